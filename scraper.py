@@ -3,21 +3,42 @@
 YC AI Startup Tracker
 This script scrapes LinkedIn to find AI startups backed by Y Combinator
 and updates a markdown file with the findings.
+
+Configuration is read from environment variables:
+    LINKEDIN_USERNAME, LINKEDIN_PASSWORD  LinkedIn credentials (mock data is used without them)
+    LINKEDIN_PROXIES                      Optional comma-separated proxies, e.g.
+                                          "http://host1:port,http://host2:port"; one is picked
+                                          per run. Use IP-allowlisted proxies: Chrome ignores
+                                          user:pass credentials, so the browser fallback cannot
+                                          authenticate against them.
 """
 
 import os
-import json
+import atexit
+import contextlib
+import asyncio
 import datetime
+import functools
+import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote, urlsplit
+import aiohttp
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
 import logging
+import random
 import re
+import shutil
+import subprocess
+import textwrap
 
 # Configure logging
 logging.basicConfig(
@@ -28,46 +49,533 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Rotated per session so repeated runs do not all present the same fingerprint. Only
+# Chrome agents, since the fallback browser is Chrome and sends Chromium client hints;
+# {major} is filled in from the installed Chrome so the version never goes stale.
+USER_AGENT_TEMPLATES = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{major}.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{major}.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{major}.0.0.0 Safari/537.36",
+]
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+# Used when no local Chrome can be found (e.g. HTTP-only runs)
+FALLBACK_CHROME_MAJOR = "141"
+
+# See the module docstring for the LINKEDIN_PROXIES format
+PROXIES = [p.strip() for p in os.environ.get("LINKEDIN_PROXIES", "").split(",") if p.strip()]
+
+LOGIN_URL = "https://www.linkedin.com/login"
+AUTH_URL = "https://www.linkedin.com/uas/authenticate"
+VOYAGER_SEARCH_URL = "https://www.linkedin.com/voyager/api/search/blended"
+FEED_URL = "https://www.linkedin.com/feed/"
+
+# Seconds before an HTTP request is abandoned (and retried, where retries apply)
+HTTP_TIMEOUT = 15
+
+# Session cookies persisted between runs so warm runs can skip the login flow
+COOKIES_FILE = "data/.cookies"
+
+# Fingerprint of the data last rendered into the README
+README_HASH_FILE = "data/.readme.hash"
+
+# Chrome profiles reused between runs by the browser fallback
+PROFILES_DIR = "data/.profiles"
+
+# Keyword variations searched concurrently on every run
+SEARCH_KEYWORDS = [
+    "Y Combinator AI startup",
+    "YC W24 AI",
+    "YC S24 AI",
+    "YC W23 AI",
+    "YC S23 AI",
+]
+
+# Result pages fetched per search; LinkedIn shows 10 results per page
+SEARCH_PAGES = 3
+RESULTS_PER_PAGE = 10
+
+# Each browser worker is a separate logged-in session, so keep this small
+MAX_BROWSER_WORKERS = 3
+
+# Pulls name, summary and link out of every search result card in one call,
+# instead of three find_element round trips to chromedriver per card
+EXTRACT_CARDS_JS = """
+return Array.from(document.querySelectorAll('div.entity-result')).map(card => ({
+    name: card.querySelector("span[dir='ltr']")?.innerText,
+    description: card.querySelector("p.entity-result__summary")?.innerText,
+    url: card.querySelector("a.app-aware-link")?.href
+}));
+"""
+COUNT_CARDS_JS = "return document.querySelectorAll('div.entity-result').length;"
+
+# Stay well inside LinkedIn's rate envelope
+MAX_CONCURRENT_REQUESTS = 5
+REQUESTS_PER_MINUTE = 30
+
+# Responses that signal LinkedIn wants us to slow down rather than give up
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 4
+# Upper bound on a server-requested Retry-After, so one reply cannot stall the job
+MAX_RETRY_AFTER = 60
+
+# Subresources the browser fallback never needs to download
+BLOCKED_URL_PATTERNS = ["*.css", "*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+# Seconds before a hung driver.get gives up (Selenium's default is 300)
+PAGE_LOAD_TIMEOUT = 30
+
+# Number of startups listed in the README
+README_MAX_ROWS = 50
+
+README_HEADER = """# Y Combinator AI Startup Tracker
+
+Automatically updated list of AI startups backed by Y Combinator found on LinkedIn.
+
+Last updated: {today}
+
+## Latest AI Startups
+
+Showing the {shown} most recently found of {total} startups. The full list is in `data/startups.jsonl`.
+
+| Name | Description | Found Date | LinkedIn |
+|------|-------------|------------|----------|
+"""
+
+README_FOOTER = """
+## How It Works
+
+This repository uses GitHub Actions to automatically:
+1. Search LinkedIn for AI startups backed by Y Combinator
+2. Update this README with the latest findings
+3. Run this process daily
+
+## Note
+
+This tool is for educational purposes only. Please respect LinkedIn's terms of service and rate limits.
+"""
+
+class RateLimiter:
+    """Token bucket allowing at most `rate` requests to start per `period` seconds"""
+    
+    def __init__(self, rate, period):
+        self.rate = rate
+        self.period = period
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be started"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.period)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.period / self.rate)
+
+def _retry_delay(error, attempt):
+    """Return how long to wait before retrying after `error`, or None if it is not transient"""
+    if isinstance(error, requests.HTTPError):
+        if error.response is None or error.response.status_code not in RETRY_STATUSES:
+            return None
+        retry_after = error.response.headers.get("Retry-After")
+    elif isinstance(error, aiohttp.ClientResponseError):
+        if error.status not in RETRY_STATUSES:
+            return None
+        retry_after = (error.headers or {}).get("Retry-After")
+    elif isinstance(error, (requests.ConnectionError, requests.Timeout, aiohttp.ClientConnectionError,
+                            asyncio.TimeoutError, TimeoutException)):
+        # Only page-load timeouts are retried for the browser; other WebDriver errors
+        # (dead session, bad arguments, ...) will not fix themselves
+        retry_after = None
+    else:
+        return None
+    
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_AFTER)
+    return min(2 ** attempt, 30) + random.random()
+
+def _with_backoff(fn, max_retries=MAX_RETRIES):
+    """Call fn, retrying with exponential backoff on rate limits and transient errors"""
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt >= max_retries:
+                raise
+            logger.warning(f"Transient error ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+async def _with_backoff_async(fn, max_retries=MAX_RETRIES):
+    """Await fn(), retrying with exponential backoff on rate limits and transient errors"""
+    attempt = 0
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt >= max_retries:
+                raise
+            logger.warning(f"Transient error ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+@functools.lru_cache(maxsize=None)
+def _chrome_major_version():
+    """Return the major version of the installed Chrome, or a recent default if there is none"""
+    for binary in CHROME_BINARIES:
+        path = shutil.which(binary)
+        if not path:
+            continue
+        try:
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+", output)
+        if match:
+            return match.group(1)
+    return FALLBACK_CHROME_MAJOR
+
+def _atomic_write(path, data, mode=0o644):
+    """Write bytes to path through a temporary file and rename, so readers never see a partial file"""
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 16) as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        # Never leave a stray temp file behind (it may hold session cookies)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp)
+        raise
+
 class LinkedInScraper:
+    # Keyword filters applied to every company description
+    _AI_RE = re.compile(r"\bAI\b|(?i:\bartificial intelligence\b)")
+    _YC_RE = re.compile(r"\bY Combinator\b|\bYC\b")
+    
     def __init__(self):
-        self.data_file = "data/startups.json"
+        self.data_file = "data/startups.jsonl"
+        self.legacy_data_file = "data/startups.json"
         self.results_file = "README.md"
+        # One date stamp per run, shared by every startup found and the README
+        self._today = datetime.date.today().isoformat()
+        self.user_agent = random.choice(USER_AGENT_TEMPLATES).format(major=_chrome_major_version())
+        self.proxy = random.choice(PROXIES) if PROXIES else None
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.user_agent})
+        if self.proxy:
+            self.session.proxies.update({"http": self.proxy, "https": self.proxy})
         self.ensure_data_dir()
+        self.startups = self.load_startups_data()
+        self.seen_names = {s["name"] for s in self.startups}
         
     def ensure_data_dir(self):
         """Ensure the data directory exists"""
         os.makedirs("data", exist_ok=True)
         
-    def setup_driver(self):
+    def setup_driver(self, profile="default"):
         """Set up the Selenium WebDriver with Chrome in headless mode"""
         chrome_options = Options()
         chrome_options.add_argument("--headless")
+        # A persistent profile keeps cookies and the HTTP cache warm across runs.
+        # Chrome locks a profile while in use, so concurrent browsers need distinct names.
+        chrome_options.add_argument(f"--user-data-dir={os.path.abspath(os.path.join(PROFILES_DIR, profile))}")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36")
+        # Same identity as the HTTP session, so one li_at is only ever seen from one UA/IP pair
+        chrome_options.add_argument(f"user-agent={self.user_agent}")
+        if self.proxy:
+            if urlsplit(self.proxy).username:
+                logger.warning("Chrome ignores proxy credentials; the browser fallback needs an IP-allowlisted proxy")
+            chrome_options.add_argument(f"--proxy-server={self.proxy}")
+        
+        # Only text is scraped, so skip downloading and decoding images
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-plugins")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+        
+        # Hand control back at DOMContentLoaded instead of waiting for every subresource
+        chrome_options.page_load_strategy = "eager"
         
         driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        
+        # Chrome has no content setting for stylesheets or fonts, so block them at the network layer
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
         return driver
     
+    @contextlib.contextmanager
+    def managed_driver(self, profile="default"):
+        """Yield a WebDriver that is always quit, even on errors or Ctrl-C"""
+        driver = self.setup_driver(profile)
+        # Belt and braces in case the interpreter exits without unwinding the with block
+        atexit.register(driver.quit)
+        try:
+            yield driver
+        finally:
+            driver.quit()
+            atexit.unregister(driver.quit)
+    
+    def login_session(self, username, password):
+        """Login to LinkedIn over plain HTTP, leaving the li_at cookie on the session"""
+        try:
+            logger.info("Logging into LinkedIn via HTTP...")
+            
+            # The login page sets the JSESSIONID cookie, which doubles as the CSRF token
+            self.http_request("GET", LOGIN_URL)
+            
+            payload = {
+                "session_key": username,
+                "session_password": password,
+                "JSESSIONID": self.csrf_token(),
+            }
+            # Sent once without retries: repeated credential posts trigger LinkedIn checkpoints
+            response = self.session.post(AUTH_URL, data=payload, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            
+            if response.json().get("login_result") != "PASS" or "li_at" not in self.session.cookies:
+                logger.warning("LinkedIn did not accept the HTTP login (challenge or bad credentials)")
+                return False
+            
+            logger.info("Successfully logged into LinkedIn via HTTP")
+            self.save_session_cookies()
+            return True
+            
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Failed to login to LinkedIn via HTTP: {e}")
+            return False
+    
+    def http_request(self, method, url, **kwargs):
+        """Send a request on the HTTP session, retrying rate-limited and transient failures"""
+        def send():
+            response = self.session.request(method, url, timeout=HTTP_TIMEOUT, **kwargs)
+            response.raise_for_status()
+            return response
+        
+        return _with_backoff(send)
+    
+    def csrf_token(self):
+        """Return the CSRF token LinkedIn expects, derived from the JSESSIONID cookie"""
+        return self.session.cookies.get("JSESSIONID", "").strip('"')
+    
+    def restore_session(self):
+        """Reuse cookies from a previous run, returning True unless they have expired"""
+        if not os.path.exists(COOKIES_FILE):
+            return False
+        
+        try:
+            with open(COOKIES_FILE, 'rb') as f:
+                self.session.cookies.update(orjson.loads(f.read()))
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Could not restore LinkedIn session: {e}")
+            return False
+        
+        try:
+            # Only the status line is needed, so the feed body is never downloaded
+            response = self.http_request("GET", FEED_URL, allow_redirects=False, stream=True)
+            response.close()
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 0
+            if status != 429 and status < 500:
+                # 401/403 and friends mean LinkedIn rejected the cookies themselves
+                logger.info(f"Saved LinkedIn session was rejected ({status})")
+                self.session.cookies.clear()
+                return False
+            # Throttling or an outage that outlasted the retries says nothing about the
+            # cookies; logging in again would be the expensive and risky path
+            logger.warning(f"Could not verify saved LinkedIn session, reusing it anyway: {e}")
+            return True
+        except (requests.ConnectionError, requests.Timeout) as e:
+            logger.warning(f"Could not verify saved LinkedIn session, reusing it anyway: {e}")
+            return True
+        except requests.RequestException as e:
+            logger.warning(f"Could not verify saved LinkedIn session: {e}")
+            return False
+        
+        # An expired session is redirected to the login page or the auth wall
+        location = response.headers.get("Location", "")
+        if response.is_redirect and ("/login" in location or "/authwall" in location):
+            logger.info("Saved LinkedIn session has expired")
+            self.session.cookies.clear()
+            return False
+        
+        logger.info("Reusing saved LinkedIn session")
+        return True
+    
+    def save_session_cookies(self):
+        """Persist the session cookies, readable by the current user only"""
+        cookies = requests.utils.dict_from_cookiejar(self.session.cookies)
+        _atomic_write(COOKIES_FILE, orjson.dumps(cookies), mode=0o600)
+    
+    def import_driver_cookies(self, driver):
+        """Copy the cookies of a logged-in browser onto the HTTP session"""
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        self.save_session_cookies()
+    
+    # Cached because the same companies come back for overlapping keyword queries and pages
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_card(name, description, url):
+        """Normalise a search hit and apply the AI / YC filter, returning None to reject it"""
+        name = (name or "").strip()
+        description = (description or "").strip()
+        
+        # Skip hits missing a name or summary (ads, people results, partial renders)
+        if not name or not description:
+            return None
+        
+        # Only include if description mentions AI and Y Combinator
+        if not (LinkedInScraper._AI_RE.search(description) and LinkedInScraper._YC_RE.search(description)):
+            return None
+        
+        return name, description, url or ""
+    
+    def make_startup(self, name, description, url):
+        """Build a startup record from a search hit, or None if it is not a YC AI startup"""
+        parsed = self._parse_card(name, description, url)
+        if parsed is None:
+            return None
+        
+        company_name, company_description, company_url = parsed
+        logger.info(f"Found YC AI startup: {company_name}")
+        return {
+            "name": company_name,
+            "description": company_description,
+            "url": company_url,
+            "found_date": self._today
+        }
+    
+    def parse_search_results(self, payload):
+        """Extract YC AI startups from a voyager search response"""
+        startups = []
+        data = payload.get("data", {})
+        
+        # Blended results are grouped into clusters, each holding its own hits
+        for cluster in data.get("elements", []):
+            for hit in cluster.get("elements", [cluster]):
+                startup = self.make_startup(
+                    (hit.get("title") or {}).get("text"),
+                    (hit.get("summary") or {}).get("text"),
+                    hit.get("navigationUrl")
+                )
+                if startup:
+                    startups.append(startup)
+        
+        return startups
+    
+    async def fetch_query(self, session, keywords, page, semaphore, rate_limiter):
+        """Run a single keyword search against LinkedIn's voyager JSON API"""
+        start = (page - 1) * RESULTS_PER_PAGE
+        url = f"{VOYAGER_SEARCH_URL}?keywords={quote(keywords)}&filters=List(resultType-%3ECOMPANIES)&origin=GLOBAL_SEARCH_HEADER&q=all&start={start}"
+        
+        async def fetch():
+            await rate_limiter.acquire()
+            async with session.get(url, proxy=self.proxy) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        
+        async with semaphore:
+            logger.info(f"Searching for YC AI startups using API: {url}")
+            payload = await _with_backoff_async(fetch)
+        
+        return self.parse_search_results(payload)
+    
+    def api_session(self):
+        """Create an aiohttp session carrying the HTTP session's login cookies and CSRF token"""
+        headers = {
+            "User-Agent": self.user_agent,
+            "csrf-token": self.csrf_token(),
+            "x-restli-protocol-version": "2.0.0",
+            "accept": "application/vnd.linkedin.normalized+json+2.1",
+        }
+        # LinkedIn's JSESSIONID value is already quoted; the default jar would quote it
+        # again and the cookie would no longer match the csrf-token header
+        cookie_jar = aiohttp.CookieJar(quote_cookie=False)
+        return aiohttp.ClientSession(
+            headers=headers,
+            cookies=self.session.cookies.get_dict(),
+            cookie_jar=cookie_jar,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+        )
+    
+    async def search_all_queries(self, keyword_list):
+        """Run every keyword search concurrently over one shared connection pool"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        rate_limiter = RateLimiter(REQUESTS_PER_MINUTE, 60)
+        
+        async with self.api_session() as session:
+            queries = [(keywords, page) for keywords in keyword_list for page in range(1, SEARCH_PAGES + 1)]
+            results = await asyncio.gather(
+                *(self.fetch_query(session, keywords, page, semaphore, rate_limiter) for keywords, page in queries),
+                return_exceptions=True
+            )
+        
+        # The same company often shows up for several keyword variations
+        startups = {}
+        failures = 0
+        for (keywords, page), result in zip(queries, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error during API search for '{keywords}' (page {page}): {result}")
+                failures += 1
+                continue
+            for startup in result:
+                startups.setdefault(startup["name"], startup)
+        
+        # Every query failing means the API path itself is unusable, not that nothing was found
+        if failures == len(queries):
+            return None
+        
+        return list(startups.values())
+    
+    def search_yc_ai_startups(self, keyword_list=SEARCH_KEYWORDS):
+        """Search for Y Combinator AI startups through LinkedIn's voyager JSON API, or None if it is unusable"""
+        startups = asyncio.run(self.search_all_queries(keyword_list))
+        if startups is None:
+            logger.error("Every API search failed")
+            return None
+        
+        logger.info(f"Found {len(startups)} YC AI startups")
+        return startups
+    
     def login_to_linkedin(self, driver, username, password):
         """Login to LinkedIn using provided credentials"""
         try:
             logger.info("Logging into LinkedIn...")
-            driver.get("https://www.linkedin.com/login")
+            _with_backoff(lambda: driver.get(LOGIN_URL))
             
-            # Wait for the login form to appear
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
+            # Wait for the login form, or the feed if /login redirected there
+            WebDriverWait(driver, 10).until(EC.any_of(
+                EC.presence_of_element_located((By.ID, "username")),
+                EC.presence_of_element_located((By.ID, "global-nav"))
+            ))
+            
+            # The persistent profile may still hold a valid session from an earlier run
+            if driver.find_elements(By.ID, "global-nav") or \
+               (driver.get_cookie("li_at") and not driver.find_elements(By.ID, "username")):
+                logger.info("Browser profile is already logged into LinkedIn")
+                return True
             
             # Enter username and password
             driver.find_element(By.ID, "username").send_keys(username)
             driver.find_element(By.ID, "password").send_keys(password)
             
             # Click login button
-            driver.find_element(By.XPATH, "//button[@type='submit']").click()
+            driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
             
             # Wait for login to complete
             WebDriverWait(driver, 10).until(
@@ -77,142 +585,187 @@ class LinkedInScraper:
             logger.info("Successfully logged into LinkedIn")
             return True
             
-        except Exception as e:
+        except WebDriverException as e:
             logger.error(f"Failed to login to LinkedIn: {e}")
             return False
     
-    def search_yc_ai_startups(self, driver):
-        """Search for Y Combinator AI startups on LinkedIn"""
+    def export_cookies_to_driver(self, driver):
+        """Load the HTTP session's cookies into a fresh browser so it starts logged in"""
+        _with_backoff(lambda: driver.get("https://www.linkedin.com"))
+        # Drop the profile's own (possibly stale) cookies so there is a single JSESSIONID
+        driver.delete_all_cookies()
+        for name, value in requests.utils.dict_from_cookiejar(self.session.cookies).items():
+            driver.add_cookie({"name": name, "value": value, "domain": ".linkedin.com"})
+    
+    def scrape_page(self, page):
+        """Scrape one page of search results in a dedicated browser"""
+        with self.managed_driver(f"page-{page}") as driver:
+            self.export_cookies_to_driver(driver)
+            return self.search_yc_ai_startups_in_browser(driver, page)
+    
+    def search_pages_in_browser(self, pages=range(1, SEARCH_PAGES + 1)):
+        """Scrape several search result pages in parallel, one browser per worker"""
+        startups = {}
+        
+        with ThreadPoolExecutor(max_workers=MAX_BROWSER_WORKERS) as executor:
+            futures = {executor.submit(self.scrape_page, page): page for page in pages}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error while scraping search page {futures[future]}: {e}")
+                    continue
+                for startup in result:
+                    startups.setdefault(startup["name"], startup)
+        
+        return list(startups.values())
+    
+    def search_yc_ai_startups_in_browser(self, driver, page=1):
+        """Search for Y Combinator AI startups on LinkedIn by scraping the rendered page"""
         startups = []
         
         try:
             # Navigate to LinkedIn search
-            search_url = "https://www.linkedin.com/search/results/companies/?keywords=Y%20Combinator%20AI%20startup"
+            search_url = f"https://www.linkedin.com/search/results/companies/?keywords=Y%20Combinator%20AI%20startup&page={page}"
             logger.info(f"Searching for YC AI startups using URL: {search_url}")
-            driver.get(search_url)
+            _with_backoff(lambda: driver.get(search_url))
             
             # Wait for search results to load
-            time.sleep(5)
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.entity-result"))
+                )
+            except TimeoutException:
+                logger.info("No search results found")
+                return startups
             
-            # Scroll to load more results
+            # Scroll to load more results, stopping once a scroll brings in no new cards
             for _ in range(3):
+                card_count = driver.execute_script(COUNT_CARDS_JS)
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                try:
+                    WebDriverWait(driver, 5).until(
+                        lambda d: d.execute_script(COUNT_CARDS_JS) > card_count
+                    )
+                except TimeoutException:
+                    break
             
-            # Extract company results
-            company_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'entity-result')]")
+            # Extract all company results in a single WebDriver round trip
+            company_cards = driver.execute_script(EXTRACT_CARDS_JS)
             
             for card in company_cards:
-                try:
-                    company_name = card.find_element(By.XPATH, ".//span[@dir='ltr']").text.strip()
-                    company_description = card.find_element(By.XPATH, ".//p[contains(@class, 'entity-result__summary')]").text.strip()
-                    
-                    # Only include if description mentions AI and Y Combinator
-                    if ("AI" in company_description or "artificial intelligence" in company_description.lower()) and \
-                       ("Y Combinator" in company_description or "YC" in company_description):
-                        
-                        try:
-                            company_url = card.find_element(By.XPATH, ".//a[contains(@class, 'app-aware-link')]").get_attribute("href")
-                        except:
-                            company_url = ""
-                            
-                        startup = {
-                            "name": company_name,
-                            "description": company_description,
-                            "url": company_url,
-                            "found_date": datetime.datetime.now().strftime("%Y-%m-%d")
-                        }
-                        
-                        startups.append(startup)
-                        logger.info(f"Found YC AI startup: {company_name}")
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to parse a company card: {e}")
-                    continue
-                    
+                startup = self.make_startup(card.get("name"), card.get("description"), card.get("url"))
+                if startup:
+                    startups.append(startup)
+            
             logger.info(f"Found {len(startups)} YC AI startups")
             return startups
             
-        except Exception as e:
+        except WebDriverException as e:
             logger.error(f"Error during search: {e}")
             return startups
     
-    def save_startups_data(self, startups):
-        """Save or update the startups data in JSON file"""
-        existing_startups = []
+    def load_startups_data(self):
+        """Load previously found startups from the JSONL data file"""
+        if not os.path.exists(self.data_file) and os.path.exists(self.legacy_data_file):
+            self.migrate_legacy_data()
         
-        # Read existing data if file exists
+        startups = []
         if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    existing_startups = json.load(f)
-            except json.JSONDecodeError:
-                existing_startups = []
-        
-        # Merge new startups with existing ones (avoid duplicates by name)
-        existing_names = [s["name"] for s in existing_startups]
-        for startup in startups:
-            if startup["name"] not in existing_names:
-                existing_startups.append(startup)
-                existing_names.append(startup["name"])
-        
-        # Save updated data
-        with open(self.data_file, 'w') as f:
-            json.dump(existing_startups, f, indent=2)
+            with open(self.data_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        startups.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        logger.warning(f"Skipping malformed line in {self.data_file}")
+        
+        return startups
+    
+    def migrate_legacy_data(self):
+        """Convert the old single-document JSON data file to JSONL"""
+        try:
+            with open(self.legacy_data_file, 'rb') as f:
+                legacy_startups = orjson.loads(f.read())
+        except orjson.JSONDecodeError as e:
+            # Stop here rather than start an empty history; the legacy file is left untouched
+            logger.error(f"Could not parse {self.legacy_data_file}, not migrating it: {e}")
+            raise
+        
+        _atomic_write(self.data_file, b"".join(orjson.dumps(startup) + b"\n" for startup in legacy_startups))
+        os.remove(self.legacy_data_file)
+        
+        logger.info(f"Migrated {len(legacy_startups)} startups from {self.legacy_data_file} to {self.data_file}")
+    
+    def save_startups_data(self, startups):
+        """Append newly found startups to the JSONL data file"""
+        new_count = 0
+        
+        # Only new names are written, so each run costs O(new) disk I/O
+        with open(self.data_file, 'ab+') as f:
+            # A hand-edited file may lack a trailing newline; don't glue the next record onto it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
             
-        logger.info(f"Saved {len(existing_startups)} startups to {self.data_file}")
+            for startup in startups:
+                if startup["name"] not in self.seen_names:
+                    f.write(orjson.dumps(startup) + b"\n")
+                    self.startups.append(startup)
+                    self.seen_names.add(startup["name"])
+                    new_count += 1
         
-        return existing_startups
+        logger.info(f"Saved {new_count} new startups to {self.data_file} ({len(self.startups)} total)")
+        
+        return self.startups
     
     def update_readme(self, startups):
         """Update the README.md with the latest startups data"""
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
-        
-        # Sort startups by found date (newest first)
-        startups.sort(key=lambda x: x.get("found_date", ""), reverse=True)
-        
-        readme_content = f"""# Y Combinator AI Startup Tracker
-
-Automatically updated list of AI startups backed by Y Combinator found on LinkedIn.
-
-Last updated: {today}
-
-## Latest AI Startups
-
-| Name | Description | Found Date | LinkedIn |
-|------|-------------|------------|----------|
-"""
+        # Only the most recently found startups are listed (newest first); the full
+        # history stays in the data file. nlargest also leaves the caller's list untouched.
+        latest = heapq.nlargest(README_MAX_ROWS, startups, key=lambda x: x.get("found_date", ""))
         
-        for startup in startups:
+        rows = []
+        for startup in latest:
             name = startup["name"]
-            description = startup["description"]
             found_date = startup.get("found_date", "N/A")
             url = startup.get("url", "")
             
-            # Create shortened description (first 100 chars)
-            short_desc = description[:100] + "..." if len(description) > 100 else description
+            # Create shortened description (about 100 chars, cut on a word boundary)
+            description = startup["description"]
+            short_desc = textwrap.shorten(description, width=100, placeholder="...")
+            if short_desc == "...":
+                # The first word alone is too long (e.g. a URL), so cut it mid-word
+                short_desc = description[:100] + "..."
             
             # Create LinkedIn link
             link = f"[Profile]({url})" if url else "N/A"
             
-            readme_content += f"| {name} | {short_desc} | {found_date} | {link} |\n"
+            rows.append(f"| {name} | {short_desc} | {found_date} | {link} |\n")
         
-        readme_content += """
-## How It Works
-
-This repository uses GitHub Actions to automatically:
-1. Search LinkedIn for AI startups backed by Y Combinator
-2. Update this README with the latest findings
-3. Run this process daily
-
-## Note
-
-This tool is for educational purposes only. Please respect LinkedIn's terms of service and rate limits.
-"""
+        # Skip the write (and a spurious "Last updated" diff) when the rendered page would
+        # be unchanged. Everything but the date goes into the hash, so changes to the row
+        # format invalidate it as well as changes to the data.
+        table = "".join(rows)
+        digest = hashlib.blake2b(README_HEADER.encode("utf-8"))
+        digest.update(f"{len(latest)}/{len(startups)}".encode("ascii"))
+        digest.update(table.encode("utf-8"))
+        digest.update(README_FOOTER.encode("utf-8"))
+        readme_hash = digest.hexdigest()
+        
+        if os.path.exists(self.results_file) and os.path.exists(README_HASH_FILE):
+            with open(README_HASH_FILE, 'r') as f:
+                if f.read().strip() == readme_hash:
+                    logger.info(f"No changes since the last update, leaving {self.results_file} as is")
+                    return
+        
+        readme_content = README_HEADER.format(today=self._today, shown=len(latest), total=len(startups)) + table + README_FOOTER
+        
+        _atomic_write(self.results_file, readme_content.encode("utf-8"))
+        _atomic_write(README_HASH_FILE, readme_hash.encode("ascii"))
         
-        with open(self.results_file, 'w') as f:
-            f.write(readme_content)
-            
         logger.info(f"Updated {self.results_file} with {len(startups)} startups")
         
     def run(self, linkedin_username=None, linkedin_password=None):
@@ -227,13 +780,13 @@ This tool is for educational purposes only. Please respect LinkedIn's terms of s
                     "name": "AI Builder",
                     "description": "Y Combinator W2024 batch. We're building AI-powered tools for software development.",
                     "url": "https://www.linkedin.com/company/aibuilder",
-                    "found_date": datetime.datetime.now().strftime("%Y-%m-%d")
+                    "found_date": self._today
                 },
                 {
                     "name": "DataSense AI",
                     "description": "YC S2023 batch. Enterprise AI solutions for data analytics.",
                     "url": "https://www.linkedin.com/company/datasense-ai",
-                    "found_date": datetime.datetime.now().strftime("%Y-%m-%d")
+                    "found_date": self._today
                 }
             ]
             
@@ -242,16 +795,22 @@ This tool is for educational purposes only. Please respect LinkedIn's terms of s
             return
         
         try:
-            driver = self.setup_driver()
-            
-            login_success = self.login_to_linkedin(driver, linkedin_username, linkedin_password)
-            if not login_success:
-                logger.error("Failed to login. Exiting.")
-                driver.quit()
-                return
+            if not (self.restore_session() or self.login_session(linkedin_username, linkedin_password)):
+                # Fall back to a real browser when LinkedIn refuses the plain HTTP login,
+                # but only to obtain session cookies for the API
+                logger.warning("Falling back to browser login")
+                with self.managed_driver() as driver:
+                    login_success = self.login_to_linkedin(driver, linkedin_username, linkedin_password)
+                    if not login_success:
+                        logger.error("Failed to login. Exiting.")
+                        return
+                    
+                    self.import_driver_cookies(driver)
             
-            startups = self.search_yc_ai_startups(driver)
-            driver.quit()
+            startups = self.search_yc_ai_startups()
+            if startups is None:
+                logger.warning("Falling back to scraping search results in the browser")
+                startups = self.search_pages_in_browser()
             
             all_startups = self.save_startups_data(startups)
             self.update_readme(all_startups)
@@ -260,8 +819,6 @@ This tool is for educational purposes only. Please respect LinkedIn's terms of s
             
         except Exception as e:
             logger.error(f"Error during execution: {e}")
-            if 'driver' in locals():
-                driver.quit()
 
 if __name__ == "__main__":
     # Get LinkedIn credentials from environment variables
@@ -0,0 +1,266 @@
+import http.server
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from aiohttp import web
+
+import scraper
+
+
+def enter_tempdir(test):
+    """Run the test from an empty temporary directory (the scraper works relative to cwd)"""
+    tmp = tempfile.TemporaryDirectory()
+    cwd = os.getcwd()
+    os.chdir(tmp.name)
+    test.addCleanup(tmp.cleanup)
+    test.addCleanup(os.chdir, cwd)
+
+
+class ApiSessionTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        enter_tempdir(self)
+        
+        async def echo(request):
+            return web.json_response({
+                "cookie": request.headers.get("Cookie", ""),
+                "csrf": request.headers.get("csrf-token", ""),
+            })
+        
+        app = web.Application()
+        app.router.add_get("/", echo)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/"
+    
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+    
+    async def test_quoted_jsessionid_is_sent_unescaped(self):
+        linkedin = scraper.LinkedInScraper()
+        linkedin.session.cookies.set("JSESSIONID", '"ajax:123"')
+        linkedin.session.cookies.set("li_at", "token")
+        
+        async with linkedin.api_session() as session:
+            async with session.get(self.url) as response:
+                echoed = await response.json()
+        
+        cookies = dict(part.split("=", 1) for part in echoed["cookie"].split("; "))
+        self.assertEqual(cookies["JSESSIONID"], '"ajax:123"')
+        self.assertEqual(cookies["li_at"], "token")
+        self.assertEqual(echoed["csrf"], "ajax:123")
+
+
+
+class RestoreSessionTest(unittest.TestCase):
+    def setUp(self):
+        enter_tempdir(self)
+        self.status = 200
+        
+        test = self
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(test.status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            
+            def log_message(self, *args):
+                pass
+        
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        
+        self.linkedin = scraper.LinkedInScraper()
+        self.linkedin.session.cookies.set("li_at", "token")
+        self.linkedin.save_session_cookies()
+        self.linkedin.session.cookies.clear()
+    
+    def restore(self, feed_url):
+        with mock.patch.object(scraper, "FEED_URL", feed_url), mock.patch.object(scraper.time, "sleep"):
+            return self.linkedin.restore_session()
+    
+    def test_rejected_cookies_are_treated_as_expired(self):
+        for status in (401, 403):
+            with self.subTest(status=status):
+                self.status = status
+                self.assertFalse(self.restore(f"http://127.0.0.1:{self.server.server_port}/feed/"))
+                self.assertNotIn("li_at", self.linkedin.session.cookies)
+    
+    def test_valid_cookies_are_reused(self):
+        self.assertTrue(self.restore(f"http://127.0.0.1:{self.server.server_port}/feed/"))
+        self.assertEqual(self.linkedin.session.cookies.get("li_at"), "token")
+    
+    def test_unreachable_server_keeps_the_saved_session(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            closed_port = sock.getsockname()[1]
+        
+        self.assertTrue(self.restore(f"http://127.0.0.1:{closed_port}/feed/"))
+        self.assertEqual(self.linkedin.session.cookies.get("li_at"), "token")
+    
+    def test_exhausted_throttling_keeps_the_saved_session(self):
+        self.status = 429
+        self.assertTrue(self.restore(f"http://127.0.0.1:{self.server.server_port}/feed/"))
+
+
+
+class UpdateReadmeTest(unittest.TestCase):
+    def setUp(self):
+        enter_tempdir(self)
+        self.linkedin = scraper.LinkedInScraper()
+        self.startups = [
+            {"name": "AI Builder", "description": "YC W24. AI tools.", "url": "https://example.com/a", "found_date": "2025-03-27"},
+            {"name": "DataSense AI", "description": "YC S23. Enterprise AI.", "url": "", "found_date": "2025-03-28"},
+        ]
+        self.linkedin.update_readme(self.startups)
+    
+    def mark_readme(self):
+        with open(self.linkedin.results_file, 'w') as f:
+            f.write("untouched")
+    
+    def read_readme(self):
+        with open(self.linkedin.results_file) as f:
+            return f.read()
+    
+    def test_unchanged_data_skips_the_write(self):
+        self.mark_readme()
+        self.linkedin.update_readme(list(self.startups))
+        self.assertEqual(self.read_readme(), "untouched")
+    
+    def test_changed_row_rewrites_the_readme(self):
+        self.mark_readme()
+        self.startups[0] = dict(self.startups[0], description="YC W24. Agents for AI builders.")
+        self.linkedin.update_readme(self.startups)
+        self.assertIn("Agents for AI builders", self.read_readme())
+    
+    def test_changed_row_rendering_rewrites_the_readme(self):
+        self.mark_readme()
+        with mock.patch.object(scraper.textwrap, "shorten", lambda text, **kwargs: text.upper()):
+            self.linkedin.update_readme(self.startups)
+        self.assertIn("YC W24. AI TOOLS.", self.read_readme())
+
+
+
+class UserAgentTest(unittest.TestCase):
+    def setUp(self):
+        enter_tempdir(self)
+        scraper._chrome_major_version.cache_clear()
+        self.addCleanup(scraper._chrome_major_version.cache_clear)
+    
+    def test_user_agent_matches_installed_chrome(self):
+        version = mock.Mock(stdout="Google Chrome 142.0.7444.59 \n")
+        with mock.patch.object(scraper.shutil, "which", return_value="/usr/bin/google-chrome"), \
+             mock.patch.object(scraper.subprocess, "run", return_value=version):
+            user_agent = scraper.LinkedInScraper().user_agent
+        
+        self.assertIn("Chrome/142.0.0.0", user_agent)
+        self.assertNotIn("Edg/", user_agent)
+        self.assertNotIn("Version/", user_agent)
+    
+    def test_falls_back_without_a_local_chrome(self):
+        with mock.patch.object(scraper.shutil, "which", return_value=None):
+            user_agent = scraper.LinkedInScraper().user_agent
+        
+        self.assertIn(f"Chrome/{scraper.FALLBACK_CHROME_MAJOR}.0.0.0", user_agent)
+
+
+
+class StartupsDataTest(unittest.TestCase):
+    STARTUPS = [
+        {"name": "AI Builder", "description": "YC W24. AI tools.", "url": "https://example.com/a", "found_date": "2025-03-27"},
+        {"name": "DataSense AI", "description": "YC S23. Enterprise AI.", "url": "", "found_date": "2025-03-28"},
+    ]
+    
+    def setUp(self):
+        enter_tempdir(self)
+        os.makedirs("data")
+    
+    def test_legacy_json_is_migrated(self):
+        with open("data/startups.json", 'wb') as f:
+            f.write(scraper.orjson.dumps(self.STARTUPS, option=scraper.orjson.OPT_INDENT_2))
+        
+        linkedin = scraper.LinkedInScraper()
+        
+        self.assertEqual(linkedin.startups, self.STARTUPS)
+        self.assertFalse(os.path.exists("data/startups.json"))
+        self.assertEqual(scraper.LinkedInScraper().startups, self.STARTUPS)
+    
+    def test_unparseable_legacy_json_is_kept(self):
+        with open("data/startups.json", 'w') as f:
+            f.write('[{"name": broken')
+        
+        with self.assertRaises(scraper.orjson.JSONDecodeError):
+            scraper.LinkedInScraper()
+        
+        with open("data/startups.json") as f:
+            self.assertEqual(f.read(), '[{"name": broken')
+        self.assertFalse(os.path.exists("data/startups.jsonl"))
+    
+    def test_saved_startups_reload_without_duplicates(self):
+        linkedin = scraper.LinkedInScraper()
+        linkedin.save_startups_data(self.STARTUPS)
+        linkedin.save_startups_data(self.STARTUPS)
+        
+        self.assertEqual(scraper.LinkedInScraper().startups, self.STARTUPS)
+    
+    def test_append_after_missing_trailing_newline(self):
+        with open("data/startups.jsonl", 'wb') as f:
+            f.write(scraper.orjson.dumps(self.STARTUPS[0]))
+        
+        scraper.LinkedInScraper().save_startups_data(self.STARTUPS)
+        
+        self.assertEqual(scraper.LinkedInScraper().startups, self.STARTUPS)
+
+
+
+class RunTest(unittest.TestCase):
+    FOUND = [{"name": "AI Builder", "description": "YC W24. AI tools.", "url": "", "found_date": "2025-03-27"}]
+    
+    def setUp(self):
+        enter_tempdir(self)
+        self.linkedin = scraper.LinkedInScraper()
+        self.linkedin.update_readme = mock.Mock()
+        self.linkedin.search_pages_in_browser = mock.Mock(return_value=self.FOUND)
+    
+    def test_every_api_query_failing_reports_none(self):
+        async def fail(*args):
+            raise scraper.aiohttp.ClientConnectionError("down")
+        
+        with mock.patch.object(self.linkedin, "fetch_query", fail):
+            self.assertIsNone(self.linkedin.search_yc_ai_startups(["YC AI"]))
+    
+    def test_browser_login_only_bootstraps_the_api_search(self):
+        self.linkedin.restore_session = mock.Mock(return_value=False)
+        self.linkedin.login_session = mock.Mock(return_value=False)
+        self.linkedin.managed_driver = mock.MagicMock()
+        self.linkedin.login_to_linkedin = mock.Mock(return_value=True)
+        self.linkedin.import_driver_cookies = mock.Mock()
+        self.linkedin.search_yc_ai_startups = mock.Mock(return_value=self.FOUND)
+        
+        self.linkedin.run("user", "password")
+        
+        self.linkedin.import_driver_cookies.assert_called_once()
+        self.linkedin.search_yc_ai_startups.assert_called_once_with()
+        self.linkedin.search_pages_in_browser.assert_not_called()
+        self.assertEqual(self.linkedin.startups, self.FOUND)
+    
+    def test_failed_api_search_falls_back_to_the_browser(self):
+        self.linkedin.restore_session = mock.Mock(return_value=True)
+        self.linkedin.search_yc_ai_startups = mock.Mock(return_value=None)
+        
+        self.linkedin.run("user", "password")
+        
+        self.linkedin.search_pages_in_browser.assert_called_once_with()
+        self.assertEqual(self.linkedin.startups, self.FOUND)
+
+
+if __name__ == "__main__":
+    unittest.main()